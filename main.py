@@ -5,11 +5,19 @@ This module provides a menu system for managing the Best Buy store. Users
 can view products, check inventory totals, make orders, and quit the program.
 """
 
+import sys
+from functools import lru_cache
+from operator import methodcaller
+
 import products
 import promotions
 import store
 
 
+# Menu choices accepted by 'get_menu_choice'
+VALID_CHOICES = frozenset({"1", "2", "3", "4"})
+
+
 def display_menu() -> None:
     """
     Displays the main menu options to the user.
@@ -24,16 +32,15 @@ def display_menu() -> None:
     print("=" * 40)
 
 
-def get_menu_choice() -> str:
+def get_menu_choice(read=input) -> str:
     """
-    Gets the user's menu choice and validates it.
+    Gets the user's menu choice, reading it with 'read', and validates it.
     """
-    valid_choices = ["1", "2", "3", "4"]  # User input choices
-    choice = input("Please choose an option (1-4): ").strip()
+    choice = read("Please choose an option (1-4): ").strip()
     # Validate the choice
-    while choice not in valid_choices:
+    while choice not in VALID_CHOICES:
         print("Invalid choice. Please enter 1, 2, 3, or 4.")
-        choice = input("Please choose an option (1-4): ").strip()
+        choice = read("Please choose an option (1-4): ").strip()
     return choice
 
 
@@ -49,29 +56,49 @@ def get_active_products(store_obj: store.Store) -> list:
 
 def display_numbered_products(products_list: list, format_func=None) -> None:
     """
-    Displays a numbered list of products using specified format.
+    Displays a numbered list of products using specified format. All lines
+    are written at once instead of one print() per product.
     """
-    product_number = 1  # Counter variable
-    for product in products_list:
-        if format_func:
-            print(f"{product_number}. {format_func(product)}")
-        else:
-            print(f"{product_number}. {product.show()}")
-        product_number += 1
+    if not products_list:
+        return
+    if format_func is None:  # Default to the product's own description
+        format_func = methodcaller("show")
+    lines = [
+        f"{product_number}. {format_func(product)}"
+        for product_number, product in enumerate(products_list, start=1)
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=256)
+def _format_price_line(name: str, price: float) -> str:
+    """
+    Builds the name and price line. Cached, as the same lines are
+    redrawn on every menu cycle.
+    """
+    return f"{name}, ${price:,.2f}"
+
+
+@lru_cache(maxsize=256)
+def _format_quantity_line(name: str, quantity: int) -> str:
+    """
+    Builds the name and quantity line. Cached like '_format_price_line'.
+    """
+    return f"{name}: {quantity} items"
 
 
 def format_price(product) -> str:
     """
     Formats product with name and price.
     """
-    return f"{product.get_name()}, ${product.get_price():,.2f}"
+    return _format_price_line(product.name, product.price)
 
 
 def format_quantity(product) -> str:
     """
     Formats product with name and quantity.
     """
-    return f"{product.get_name()}: {product.get_quantity()} items"
+    return _format_quantity_line(product.name, product.quantity)
 
 
 def print_section_header(title: str) -> None:
@@ -109,33 +136,60 @@ def validate_num_input(input_str: str, input_type: str) -> int:
     """
     Validates that input is a positive integer.
     """
-    if not input_str.isdigit():
+    # Parse once; int() rejects anything that is not a whole number
+    try:
+        num_input = int(input_str)
+    except ValueError:
         print(f"Please enter a valid {input_type}.")
         return None
-    num_input = int(input_str)
     if num_input <= 0:
         print(f"{input_type.capitalize()} must be greater than 0.")
         return None
     return num_input
 
 
-def get_product_selection(max_products: int) -> int:
+def read_piped_line(prompt: str = "") -> str:
     """
-    Gets and validates product selection.
+    Drop-in replacement for input() when stdin is not a terminal (e.g. an
+    order file piped in). Skips writing the prompt. Like input(), raises
+    EOFError at the end of input.
     """
-    product_choice = input(
-        "\nEnter product number (or press Enter to finish):"
-        ).strip()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+@lru_cache(maxsize=None)
+def get_reader():
+    """
+    Returns the function used to read user input: input() when stdin is a
+    terminal, 'read_piped_line' otherwise. Checked once, on first use.
+    """
+    return input if sys.stdin.isatty() else read_piped_line
+
+
+def get_product_selection(max_products: int, read=input) -> int:
+    """
+    Gets and validates product selection, reading input with 'read'.
+    """
+    try:
+        product_choice = read(
+            "\nEnter product number (or press Enter to finish):"
+            ).strip()
+    except EOFError:  # End of input finishes the cart
+        return -1
     # Checks if user wants to finish
     if not product_choice:
         return -1  # Breaks loop in build_cart 'if product_index == -1:'
 
     # Validate input is a number
-    if not product_choice.isdigit():
+    try:
+        product_index = int(product_choice) - 1  # Convert to 0-based index
+    except ValueError:
         print("Please enter a valid number.")
         return None
 
-    product_index = int(product_choice) - 1  # Convert to 0-based indexing
     # Check if index is valid --> cannot be "<1" or "> # active products"
     if not 0 <= product_index < max_products:
         print(f"Please enter a number between 1 and {max_products}.")
@@ -143,11 +197,14 @@ def get_product_selection(max_products: int) -> int:
     return product_index
 
 
-def get_quantity_from_user() -> int:
+def get_quantity_from_user(read=input) -> int:
     """
-    Gets and validates quantity from user input.
+    Gets and validates quantity from user input, reading it with 'read'.
     """
-    quantity_str = input("Enter quantity: ").strip()
+    try:
+        quantity_str = read("Enter quantity: ").strip()
+    except EOFError:  # End of input; the cart is finished on the next read
+        return None
     return validate_num_input(quantity_str, "quantity")
 
 
@@ -159,7 +216,7 @@ def check_availability(product, requested_qty: int, cart_qty: int) -> bool:
     if isinstance(product, products.NonStockedProduct):
         return True
     
-    available_qty = product.get_quantity()
+    available_qty = product.quantity
     remaining_qty = available_qty - cart_qty
     if requested_qty > remaining_qty:
         if cart_qty > 0:
@@ -177,31 +234,33 @@ def build_cart(active_products: list) -> list:
     """
     Builds cart through user interaction.
     """
-    cart = []
-    cart_quantities = {}  # Track quantities in cart
+    # One (product, quantity) entry per product, keyed by id(product)
+    cart = {}
+    # Prompt only when interactive; piped input is read line by line
+    read = get_reader()
 
     while True:
         # Get product selection for cart
-        product_index = get_product_selection(len(active_products))
+        product_index = get_product_selection(len(active_products), read)
         if product_index == -1:  # User wants to finish
             break
         if product_index is None:  # Invalid input
             continue
         # Get quantity
-        quantity = get_quantity_from_user()
+        quantity = get_quantity_from_user(read)
         if quantity is None:  # Invalid input
             continue
         # Check availability
         selected_product = active_products[product_index]
-        already_in_cart = cart_quantities.get(product_index, 0)
+        product_id = id(selected_product)
+        already_in_cart = cart.get(product_id, (None, 0))[1]
         if not check_availability(selected_product, quantity, already_in_cart):
             continue
-        # Add to cart and update quantities
-        cart.append((selected_product, quantity))
-        cart_quantities[product_index] = already_in_cart + quantity
+        # Add to cart, merging with any earlier line for the same product
+        cart[product_id] = (selected_product, already_in_cart + quantity)
         print(f"Added {quantity} x {selected_product.show()}")
 
-    return cart
+    return list(cart.values())
 
 
 def process_order(store_obj: store.Store, cart: list) -> None:
@@ -249,17 +308,20 @@ def quit_program(store_obj: store.Store) -> None:
     print("Goodbye!")
 
 
+# Maps menu choices to their actions; built once at import time
+MENU_ACTIONS = {
+    "1": list_all_products,
+    "2": show_total_quantity,
+    "3": make_order,
+    "4": quit_program
+    }
+
+
 def call_menu_action(store_obj: store.Store, choice: str) -> None:
     """
     Calls the appropriate menu action based on user choice.
     """
-    menu_actions = {
-        "1": list_all_products,
-        "2": show_total_quantity,
-        "3": make_order,
-        "4": quit_program
-        }
-    action = menu_actions.get(choice)
+    action = MENU_ACTIONS.get(choice)
     if action:
         action(store_obj)
     else:
@@ -268,17 +330,26 @@ def call_menu_action(store_obj: store.Store, choice: str) -> None:
 
 def start(store_obj: store.Store) -> None:
     """
-    Runs menu execution.
+    Runs menu execution. The end of input (e.g. of a piped order file)
+    quits the program.
     """
+    read = get_reader()
     print("Welcome to Best Buy Store Management System!")
     while True:
         display_menu()
-        choice = get_menu_choice()
+        try:
+            choice = get_menu_choice(read)
+        except EOFError:  # No more input: quit
+            choice = "4"
         call_menu_action(store_obj, choice)
         if choice == "4":  # Exit if user chose quit
             break
         # Pause before showing menu again
-        input("\nPress Enter to continue...")
+        try:
+            read("\nPress Enter to continue...")
+        except EOFError:  # No more input: quit
+            quit_program(store_obj)
+            break
 
 
 def main() -> None:
@@ -9,9 +9,16 @@ has specific behavior for inventory management and purchasing.
 
 class Product:
     """
-    Represents a product available in the Best Buy store.
+    Represents a product available in the Best Buy store. Change the
+    quantity through 'set_quantity', so listeners stay in sync.
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "name", "price", "quantity", "active", "promotion", "_listeners",
+        "_show_cache"
+        )
+
     def __init__(self, name: str, price: float, quantity: int) -> None:
         """
         Creates a new product with validation. Raises ValueError if name is
@@ -30,6 +37,30 @@ class Product:
             raise ValueError("Product quantity cannot be negative")
 
         # If all validations pass, create the product
+        self._setup(name, price, quantity)
+
+    @classmethod
+    def _unchecked(cls, name: str, price: float, quantity: int) -> "Product":
+        """
+        Creates a product without validating the arguments. Only for trusted
+        internal callers (e.g. bulk-loading a known-good catalog) that have
+        already checked their data; no such caller exists yet. Raises
+        TypeError for subclasses, as their own set up (e.g. 'maximum',
+        always active) would be skipped.
+        """
+        if cls is not Product:
+            raise TypeError(
+                f"{cls.__name__} must be created through its constructor"
+                )
+        product = cls.__new__(cls)
+        product._setup(name, price, quantity)
+        return product
+
+    def _setup(self, name: str, price: float, quantity: int) -> None:
+        """
+        Sets the initial product state. Shared by '__init__' and
+        '_unchecked' so both create identical products.
+        """
         self.name = name
         self.price = price
         self.quantity = quantity
@@ -41,6 +72,12 @@ class Product:
         # Initialize promotion as None
         self.promotion = None
 
+        # Listeners notified of state changes (e.g. a Store's caches)
+        self._listeners = set()
+
+        # Cached 'show' output, as a (shown details, string) pair
+        self._show_cache = None
+
     def get_quantity(self) -> int:
         """
         Returns the current quantity of the product.
@@ -51,7 +88,10 @@ class Product:
         """
         Updates the product quantity and deactivates if it reaches 0.
         """
+        old_quantity = self.quantity
         self.quantity = quantity
+        for listener in self._listeners:
+            listener.on_quantity_change(self, old_quantity, quantity)
 
         # If quantity reaches 0, deactivates the product
         if self.quantity == 0:
@@ -67,13 +107,33 @@ class Product:
         """
         Activates the product so it can be sold.
         """
-        self.active = True
+        if not self.active:  # Only notify listeners on an actual change
+            self.active = True
+            for listener in self._listeners:
+                listener.on_active_change(self, True)
 
     def deactivate(self) -> None:
         """
         Deactivates the product so it cannot be sold.
         """
-        self.active = False
+        if self.active:  # Only notify listeners on an actual change
+            self.active = False
+            for listener in self._listeners:
+                listener.on_active_change(self, False)
+
+    def add_listener(self, listener) -> None:
+        """
+        Registers a listener (e.g. a Store) that is notified through its
+        'on_active_change' method whenever the product is (de)activated and
+        through its 'on_quantity_change' method whenever the quantity is set.
+        """
+        self._listeners.add(listener)
+
+    def remove_listener(self, listener) -> None:
+        """
+        Unregisters a previously added listener.
+        """
+        self._listeners.discard(listener)
 
     def get_promotion(self):
         """
@@ -89,7 +149,33 @@ class Product:
 
     def show(self) -> str:
         """
-        Returns a string representation of the product.
+        Returns a string representation of the product. The string is reused
+        while the details it was built from are unchanged.
+        """
+        details = self._shown_details()
+        cache = self._show_cache
+        if cache is None or cache[0] != details:
+            cache = self._show_cache = (details, self._describe())
+        return cache[1]
+
+    def _shown_details(self) -> tuple:
+        """
+        Returns the details 'show' depends on. Subclasses that show more
+        details override this together with '_describe'.
+        """
+        promotion = self.promotion
+        return (
+            self.name,
+            self.price,
+            self.quantity,
+            promotion,
+            promotion.name if promotion else None
+            )
+
+    def _describe(self) -> str:
+        """
+        Builds the string representation returned by 'show'. Subclasses
+        override this to add their own details.
         """
         product_info = (f"{self.name}, "
                         f"Price: {self.price}, "
@@ -151,6 +237,8 @@ class NonStockedProduct(Product):
     licenses). Quantity is always 0 but the product remains active.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, price: float) -> None:
         """
         Creates a non-stocked product. Note: no quantity parameter needed.
@@ -166,12 +254,12 @@ class NonStockedProduct(Product):
         """
         pass  # Do nothing - quantity stays '0'
 
-    def show(self) -> str:
+    def _describe(self) -> str:
         """
         Shows product information with indication it's non-stocked.
         """
-        # Overrides parent's show method, adding the 'special characteristics'
-        return f"{super().show()} (Non-Stocked)"
+        # Overrides parent's method, adding the 'special characteristics'
+        return f"{super()._describe()} (Non-Stocked)"
 
     def buy(self, quantity: int) -> float:
         """
@@ -194,6 +282,8 @@ class LimitedProduct(Product):
     per order (e.g., shipping fees that can only be added once).
     """
 
+    __slots__ = ("maximum",)
+
     def __init__(
             self,
             name: str,
@@ -209,12 +299,18 @@ class LimitedProduct(Product):
         # Add the new maximum attribute
         self.maximum = maximum
 
-    def show(self) -> str:
+    def _shown_details(self) -> tuple:
+        """
+        Adds the purchase limit to the details 'show' depends on.
+        """
+        return (*super()._shown_details(), self.maximum)
+
+    def _describe(self) -> str:
         """
         Shows product information including purchase limit.
         """
-        # Get parent's show output and add limit info
-        return f"{super().show()} (Limited to {self.maximum} per order)"
+        # Get parent's description and add limit info
+        return f"{super()._describe()} (Limited to {self.maximum} per order)"
 
     def buy(self, quantity: int) -> float:
         """
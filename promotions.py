@@ -1,33 +1,37 @@
 """
 Promotions module for Best Buy store management system.
 
-This module contains the abstract Promotion class and concrete promotion
+This module contains the base Promotion class and concrete promotion
 implementations for different discount strategies.
 """
 
-from abc import ABC, abstractmethod
+# Quantities below this use precomputed lookup tables
+PAID_UNITS_TABLE_SIZE = 256
 
 
-class Promotion(ABC):
+class Promotion:
     """
-    Abstract base class for all promotions.
+    Base class for all promotions. Subclasses must override
+    'apply_promotion'.
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         """
         Initializes promotion with a name.
         """
         self.name = name
 
-    @abstractmethod
     def apply_promotion(self, product, quantity: int) -> float:
         """
-        Abstract method that must be implemented by all promotions.
+        Method that must be implemented by all promotions.
         Calculates discounted price for given product and quantity.
-        
-        'pass' statement is unnecessary when you have a docstring in the 
-        method body. The docstring itself serves as the method body.
         """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement apply_promotion"
+            )
 
 
 class PercentDiscount(Promotion):
@@ -36,23 +40,27 @@ class PercentDiscount(Promotion):
     For example: 30% off means customer pays 70% of original price.
     """
 
+    __slots__ = ("percent", "_multiplier")
+
     def __init__(self, name: str, percent: float) -> None:
         """
-        Creates a percentage discount promotion.
+        Creates a percentage discount promotion. Raises ValueError if percent
+        is not between 0 and 100.
         """
+        # Validate percent once, so applying the promotion needs no checks
+        if not 0 <= percent <= 100:
+            raise ValueError("Discount percent must be between 0 and 100")
+
         super().__init__(name)
         self.percent = percent
+        # Precompute the multiplier (e.g., 30% off = pay 70%)
+        self._multiplier = (100.0 - percent) / 100.0
 
     def apply_promotion(self, product, quantity: int) -> float:
         """
         Calculates price after percentage discount.
         """
-        # Calculate normal total price
-        total_price = product.price * quantity
-        # Apply discount (e.g., 30% off = pay 70%)
-        discount_multiplier = (100 - self.percent) / 100
-        discounted_price = total_price * discount_multiplier
-        return discounted_price
+        return product.price * quantity * self._multiplier
 
 
 class SecondHalfPrice(Promotion):
@@ -61,10 +69,25 @@ class SecondHalfPrice(Promotion):
     For example: Buy 2 items, pay full price for 1st, half for 2nd.
     """
 
+    __slots__ = ()
+
+    # (full-price items, half-price items) by quantity
+    _ITEM_SPLIT = tuple(
+        ((q + 1) // 2, q // 2) for q in range(PAID_UNITS_TABLE_SIZE)
+        )
+
     def apply_promotion(self, product, quantity: int) -> float:
         """
         Calculates price where every second item is half price.
         """
+        # Common case: look up the precomputed split, same arithmetic below
+        if 0 <= quantity < PAID_UNITS_TABLE_SIZE:
+            full_price_items, half_price_items = self._ITEM_SPLIT[quantity]
+            return (
+                    (full_price_items * product.price) + (
+                    half_price_items * product.price * 0.5)
+            )
+
         # Calculate quantity of full- and half-price items
         full_price_items = (quantity + 1) // 2  # Integer division
         half_price_items = quantity // 2
@@ -83,10 +106,21 @@ class ThirdOneFree(Promotion):
     For example: Buy 3, pay for 2. Buy 6, pay for 4.
     """
 
+    __slots__ = ()
+
+    # Items paid for, by quantity
+    _PAID_UNITS = tuple(
+        (q // 3) * 2 + (q % 3) for q in range(PAID_UNITS_TABLE_SIZE)
+        )
+
     def apply_promotion(self, product, quantity: int) -> float:
         """
         Calculates price where every third item is free.
         """
+        # Common case: look up the precomputed units
+        if 0 <= quantity < PAID_UNITS_TABLE_SIZE:
+            return self._PAID_UNITS[quantity] * product.price
+
         # For every 3 items, pay for only 2
         paid_items = (quantity // 3) * 2 + (quantity % 3)
         # Calculate total
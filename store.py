@@ -19,60 +19,118 @@ class Store:
         Creates a new store with an initial list of products.
         """
         self.products = products_list
+        # Ids of the products in the store, for O(1) membership checks
+        self._product_ids = {id(product) for product in products_list}
+        # Cached active products, kept up to date via 'on_active_change'
+        self._active = [p for p in products_list if p.active]
+        # Number of inactive products; while 0, every product is active
+        self._deactivated_count = len(products_list) - len(self._active)
+        # Cached total quantity, kept up to date via 'on_quantity_change'
+        self._total_quantity = sum(p.quantity for p in products_list)
+        for product in products_list:
+            product.add_listener(self)
 
     def add_product(self, product) -> None:
         """
-        Adds a product to the store inventory.
+        Adds a product to the store inventory. Products already in the store
+        are ignored.
         """
+        if id(product) in self._product_ids:
+            return
+        self._product_ids.add(id(product))
         self.products.append(product)
+        product.add_listener(self)
+        self._total_quantity += product.get_quantity()
+        if product.is_active():
+            self._active.append(product)
+        else:
+            self._deactivated_count += 1
 
     def remove_product(self, product) -> None:
         """
-        Removes a product from store.
+        Removes a product from store. The remaining products keep their
+        order, as the menu numbers them by position.
         """
-        # Checks if product exists in the list
-        if product in self.products:
+        # Checks if product exists in the store (O(1) lookup)
+        if id(product) in self._product_ids:
+            self._product_ids.remove(id(product))
             self.products.remove(product)
+            product.remove_listener(self)
+            self._total_quantity -= product.get_quantity()
+            if product.is_active():
+                self._active.remove(product)
+            else:
+                self._deactivated_count -= 1
+
+    def on_active_change(self, product, active: bool) -> None:
+        """
+        Called by a product when it is activated or deactivated. Keeps the
+        cached list of active products in sync.
+        """
+        if active:
+            self._deactivated_count -= 1
+            if self._deactivated_count == 0:
+                # Fast path: every product is active again
+                self._active = self.products.copy()
+            else:
+                # Rebuild so the cache keeps the store's product order
+                self._active = [p for p in self.products if p.active]
+        else:
+            self._deactivated_count += 1
+            self._active.remove(product)
+
+    def on_quantity_change(
+            self,
+            product,
+            old_quantity: int,
+            new_quantity: int
+            ) -> None:
+        """
+        Called by a product when its quantity is set. Keeps the cached total
+        quantity in sync.
+        """
+        self._total_quantity += new_quantity - old_quantity
 
     def get_total_quantity(self) -> int:
         """
         Returns how many items are in the store in total.
         """
-        total = 0  # Counter variable
-        for product in self.products:
-            total += product.get_quantity()
-        return total
+        return self._total_quantity
 
     def get_all_products(self) -> list:
         """
-        Returns all products in the store that are active.
+        Returns all products in the store that are active. Returns a copy of
+        the cached list, so callers may modify it freely.
         """
-        active_products = []
-        for product in self.products:
-            if product.is_active():
-                active_products.append(product)
-        return active_products
+        return self._active.copy()
 
     def order(self, shopping_list: list) -> float:
         """
         Gets a list of tuples where each tuple has 2 items:
          - Product (Product class)
          - Quantity (int).
-        Buys the products and returns the total price of the order.
+        Buys the products and returns the total price of the order. Lines
+        for the same product are merged and bought in a single purchase, so
+        a merged line that fails (e.g. more than in stock, or above a
+        LimitedProduct's maximum) buys none of that product, rather than
+        buying the earlier lines and failing only the later ones.
         """
         total_price = 0.0  # Counter variable
 
-        # Process each item in the shopping list
-        for item in shopping_list:
-            # Extract product and quantity from tuple
-            product = item[0]
-            quantity = item[1]
+        # Merge lines per product, keyed by id(product), keeping list order
+        merged = {}
+        for product, quantity in shopping_list:
+            product_id = id(product)
+            if product_id in merged:
+                quantity += merged[product_id][1]
+            merged[product_id] = (product, quantity)
 
+        # Process each item, unpacking product and quantity from the tuple
+        for product, quantity in merged.values():
             # Try to buy the product
             try:
                 # Buy returns the price for this purchase
-                item_price = product.buy(quantity)
-                total_price += item_price
+                total_price += product.buy(quantity)
             except ValueError as e:
                 # If there's an error, print it and continue
                 print(f"Error ordering {product.get_name()}: {e}")
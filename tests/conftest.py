@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the Best Buy store tests.
+
+The products, promotions, store and main modules are imported inside
+session-scoped fixtures rather than at module level, so
+'pytest --collect-only' does not import them.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def Product():
+    """
+    Provides the Product class.
+    """
+    from products import Product as product_class
+    return product_class
+
+
+@pytest.fixture(scope="session")
+def NonStockedProduct():
+    """
+    Provides the NonStockedProduct class.
+    """
+    from products import NonStockedProduct as product_class
+    return product_class
+
+
+@pytest.fixture(scope="session")
+def LimitedProduct():
+    """
+    Provides the LimitedProduct class.
+    """
+    from products import LimitedProduct as product_class
+    return product_class
+
+
+@pytest.fixture(scope="session")
+def Store():
+    """
+    Provides the Store class.
+    """
+    from store import Store as store_class
+    return store_class
+
+
+@pytest.fixture(scope="session")
+def PercentDiscount():
+    """
+    Provides the PercentDiscount promotion class.
+    """
+    from promotions import PercentDiscount as promotion_class
+    return promotion_class
+
+
+@pytest.fixture(scope="session")
+def SecondHalfPrice():
+    """
+    Provides the SecondHalfPrice promotion class.
+    """
+    from promotions import SecondHalfPrice as promotion_class
+    return promotion_class
+
+
+@pytest.fixture(scope="session")
+def main():
+    """
+    Provides the main (menu) module.
+    """
+    import main as main_module
+    return main_module
+
+
+@pytest.fixture(scope="session")
+def ThirdOneFree():
+    """
+    Provides the ThirdOneFree promotion class.
+    """
+    from promotions import ThirdOneFree as promotion_class
+    return promotion_class
+
+
+@pytest.fixture(scope="session")
+def product_cache(Product):
+    """
+    Provides a factory that creates each product once per session, keyed by
+    its constructor arguments. Only for tests that do not modify the
+    product; tests that do should create their own.
+    """
+    cache = {}
+
+    def make(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = Product(**kwargs)
+        return cache[key]
+    return make
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Runs the cheap constructor tests (marked 'ctor') first, so their
+    failures are reported as early as possible. The sort is stable, so all
+    other tests keep their collected order. Plugins that shuffle tests
+    (e.g. pytest-randomly) undo this and can be disabled with
+    '-p no:randomly'.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("ctor") is None)
@@ -0,0 +1,77 @@
+"""
+Unit tests for the menu interface.
+
+This module tests reading user input from a piped (non-terminal) stdin.
+"""
+
+import io
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def piped_stdin(main, monkeypatch):
+    """
+    Provides a function replacing stdin with the given piped text. Resets
+    the cached input reader, so it is chosen again for the piped stdin.
+    """
+    def pipe(text):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+        main.get_reader.cache_clear()
+    yield pipe
+    main.get_reader.cache_clear()
+
+
+def test_build_cart_reads_piped_input_without_prompts(
+        main,
+        Product,
+        piped_stdin,
+        capsys
+        ):
+    """
+    Tests that piped input builds the cart without printing prompts, merges
+    lines for the same product and finishes the cart at the end of input.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    piped_stdin("1\n2\n1\n3\n2\n1\n")
+    cart = main.build_cart([macbook, pixel])
+    assert cart == [(macbook, 5), (pixel, 1)]
+    output = capsys.readouterr().out
+    assert "Enter quantity" not in output
+    assert "Enter product number" not in output
+
+
+def test_build_cart_ignores_quantity_missing_at_end_of_input(
+        main,
+        Product,
+        piped_stdin
+        ):
+    """
+    Tests that input ending before the quantity finishes the cart without
+    adding the selected product.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    piped_stdin("1\n")
+    assert main.build_cart([macbook]) == []
+
+
+def test_start_quits_at_end_of_piped_input(
+        main,
+        Product,
+        Store,
+        piped_stdin,
+        capsys
+        ):
+    """
+    Tests that the menu reads piped choices and quits at the end of input
+    instead of raising EOFError.
+    """
+    best_buy = Store([Product("MacBook Air M2", price=1450, quantity=100)])
+    piped_stdin("2\n")
+    main.start(best_buy)
+    output = capsys.readouterr().out
+    assert "Total items in store: 100" in output
+    assert "Please choose an option" not in output
+    assert output.endswith("Goodbye!\n")
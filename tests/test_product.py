@@ -0,0 +1,241 @@
+"""
+Unit tests for the Product class.
+
+This module tests all functionality of the Product class including
+normal operations and error handling.
+"""
+
+import pytest
+from pytest import raises  # Bound once, instead of looked up in each test
+
+# Valid constructor arguments; every case is a separate, shardable test
+VALID_CASES = [
+    dict(name="MacBook Air M2", price=1450, quantity=100),
+    dict(name="Google Pixel 7", price=500, quantity=250),
+    dict(name="Free Sample", price=0, quantity=1),
+    ]
+VALID_CASE_IDS = ["macbook", "pixel", "zero-price"]
+
+
+@pytest.fixture(scope="module", params=VALID_CASES, ids=VALID_CASE_IDS)
+def valid_case(request):
+    """
+    Provides each set of valid constructor arguments in turn.
+    """
+    return request.param
+
+
+@pytest.fixture
+def valid_product(product_cache, valid_case):
+    """
+    Provides a valid product, created once per session and case. Only for
+    tests that do not modify it.
+    """
+    return product_cache(**valid_case)
+
+
+@pytest.fixture
+def make_product(Product):
+    """
+    Provides a factory creating a new product per call, for tests that
+    modify it. Keyword arguments override the defaults.
+    """
+    def make(**kwargs):
+        return Product(**{"name": "X", "price": 1, "quantity": 1, **kwargs})
+    return make
+
+
+@pytest.mark.ctor
+def test_create_product_with_valid_data(valid_case, valid_product):
+    """
+    Tests that creating a product with valid data works.
+    """
+    # Checks all attributes were set correctly
+    assert valid_product.get_name() == valid_case["name"]
+    assert valid_product.get_price() == valid_case["price"]
+    assert valid_product.get_quantity() == valid_case["quantity"]
+    assert valid_product.is_active()  # Active with quantity > 0
+
+
+@pytest.mark.ctor
+@pytest.mark.parametrize("kwargs", [
+    dict(name="", price=1450, quantity=100),
+    dict(name="MacBook Air M2", price=-10, quantity=100),
+    dict(name="MacBook Air M2", price=1450, quantity=-5),
+    ], ids=["empty-name", "neg-price", "neg-qty"])
+def test_ctor_rejects_invalid_data(Product, kwargs):
+    """
+    Tests that an empty name, negative price or negative quantity raises
+    ValueError.
+    """
+    # Should raise a ValueError
+    with raises(ValueError):
+        Product(**kwargs)
+
+
+def test_product_becomes_inactive_at_zero_quantity(make_product):
+    """
+    Tests that when a product reaches 0 quantity, it becomes inactive.
+    """
+    # Creates a product with a specified quantity
+    product = make_product(name="iPhone 14", price=999, quantity=1)
+    assert product.is_active()  # Verifies product is active initially
+    product.set_quantity(0)  # Sets quantity to 0
+    assert not product.is_active()  # Checks product is inactive
+    assert product.get_quantity() == 0  # Checks product is inactive
+
+
+@pytest.mark.parametrize("price, initial_qty, buy_qty, total, left, active", [
+    (250, 500, 50, 12500.0, 450, True),  # Partial purchase stays active
+    (500, 5, 5, 2500.0, 0, False),  # Buying all stock deactivates
+    ], ids=["partial", "sold-out"])
+def test_buy_updates_quantity_and_active_state(
+        make_product,
+        price,
+        initial_qty,
+        buy_qty,
+        total,
+        left,
+        active
+        ):
+    """
+    Tests that product purchase returns the correct price, reduces the
+    quantity and deactivates the product once all stock is bought.
+    """
+    product = make_product(price=price, quantity=initial_qty)
+    # Checks total price is correct
+    assert product.buy(buy_qty) == pytest.approx(total, rel=1e-9)
+    assert product.get_quantity() == left  # Checks quantity was reduced
+    assert product.is_active() == active  # Checks the active state
+
+
+def test_buying_larger_quantity_than_available_raises_exception(
+        make_product
+        ):
+    """
+    Tests that buying a larger quantity than exists invokes exception.
+    """
+    # Creates a product with limited stock
+    product = make_product(name="Laptop Stand", price=50, quantity=3)
+    # Try to buy more than available
+    with raises(ValueError):
+        product.buy(10)  # Only 3 available!
+    # Verify quantity didn't change
+    assert product.get_quantity() == 3
+
+
+def test_buying_from_inactive_product_raises_exception(make_product):
+    """
+    Tests that buying from an inactive product raises ValueError.
+    """
+    # Creates and deactivates a product
+    product = make_product(name="Old Stock Item", price=10, quantity=0)
+    assert not product.is_active()  # Verify product is inactive
+    with raises(ValueError):  # Try to buy from inactive product
+        product.buy(1)
+
+
+@pytest.mark.parametrize("quantity", [0, -5], ids=["zero", "negative"])
+def test_buying_zero_or_negative_quantity_raises_exception(
+        make_product,
+        valid_case,
+        quantity
+        ):
+    """
+    Tests that buying zero or negative quantity raises ValueError.
+    """
+    # buy() modifies the product, so use a fresh one, not the shared cache
+    product = make_product(**valid_case)
+    with raises(ValueError):
+        product.buy(quantity)
+    # Left unchanged
+    assert product.get_quantity() == valid_case["quantity"]
+
+
+@pytest.mark.ctor
+def test_unchecked_creation_matches_validated_creation(
+        Product,
+        product_cache
+        ):
+    """
+    Tests that the trusted '_unchecked' factory creates the same product
+    state as the validating constructor.
+    """
+    checked = product_cache(name="MacBook Air M2", price=1450, quantity=100)
+    unchecked = Product._unchecked("MacBook Air M2", price=1450, quantity=100)
+    assert unchecked.show() == checked.show()
+    assert unchecked.is_active()
+    assert not Product._unchecked("Old Stock Item", 10, 0).is_active()
+
+
+@pytest.mark.ctor
+def test_unchecked_creation_rejects_subclasses(
+        NonStockedProduct,
+        LimitedProduct
+        ):
+    """
+    Tests that '_unchecked' refuses subclasses, whose own set up it would
+    skip.
+    """
+    with raises(TypeError):
+        NonStockedProduct._unchecked("Windows License", 125, 0)
+    with raises(TypeError):
+        LimitedProduct._unchecked("Shipping", 10, 250)
+
+
+def test_show_reflects_quantity_and_promotion_changes(
+        make_product,
+        PercentDiscount
+        ):
+    """
+    Tests that the product description is updated after the quantity or
+    the promotion change.
+    """
+    product = make_product(name="Google Pixel 7", price=500, quantity=250)
+    assert product.show() == "Google Pixel 7, Price: 500, Quantity: 250"
+    product.buy(10)
+    assert product.show() == "Google Pixel 7, Price: 500, Quantity: 240"
+    product.set_promotion(PercentDiscount("30% off!", percent=30))
+    assert product.show() == (
+        "Google Pixel 7, Price: 500, Quantity: 240, Promotion: 30% off!"
+        )
+
+
+def test_show_reflects_reassigned_attributes(
+        make_product,
+        LimitedProduct,
+        PercentDiscount
+        ):
+    """
+    Tests that the product description is updated after public attributes
+    are reassigned directly, or the promotion is renamed.
+    """
+    product = make_product(name="USB Cable", price=10, quantity=5)
+    assert product.show() == "USB Cable, Price: 10, Quantity: 5"
+    product.name = "USB-C Cable"
+    product.price = 20
+    product.quantity = 4
+    assert product.show() == "USB-C Cable, Price: 20, Quantity: 4"
+    product.promotion = PercentDiscount("30% off!", percent=30)
+    assert product.show().endswith("Promotion: 30% off!")
+    product.promotion.name = "Sale!"
+    assert product.show().endswith("Promotion: Sale!")
+    shipping = LimitedProduct("Shipping", price=10, quantity=250, maximum=1)
+    assert shipping.show().endswith("(Limited to 1 per order)")
+    shipping.maximum = 2
+    assert shipping.show().endswith("(Limited to 2 per order)")
+
+
+def test_buy_applies_promotion_until_removed(make_product, PercentDiscount):
+    """
+    Tests that buying uses the promotion price while a promotion is set,
+    whether set through 'set_promotion' or the attribute, and the regular
+    price again after 'set_promotion(None)'.
+    """
+    product = make_product(price=100, quantity=10)
+    product.set_promotion(PercentDiscount("30% off!", percent=30))
+    assert product.buy(2) == pytest.approx(140.0)
+    product.set_promotion(None)
+    assert product.buy(2) == pytest.approx(200.0)
+    product.promotion = PercentDiscount("50% off!", percent=50)
+    assert product.buy(2) == pytest.approx(100.0)
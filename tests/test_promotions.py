@@ -0,0 +1,112 @@
+"""
+Unit tests for the promotion classes.
+
+This module checks the promotion prices, including the precomputed tables
+used for small quantities, against the plain formulas.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+# Quantities on both sides of the table boundary (PAID_UNITS_TABLE_SIZE)
+QUANTITIES = [0, 1, 2, 255, 256, 1000]
+QUANTITY_IDS = ["q0", "q1", "q2", "q255", "q256", "q1000"]
+# Whole and fractional unit prices
+PRICES = [100, 19.99, 0.1]
+PRICE_IDS = ["whole", "cents", "tenth"]
+
+
+@pytest.mark.parametrize("quantity", QUANTITIES, ids=QUANTITY_IDS)
+@pytest.mark.parametrize("price", PRICES, ids=PRICE_IDS)
+def test_second_half_price_matches_formula(SecondHalfPrice, price, quantity):
+    """
+    Tests that every second item is charged half price.
+    """
+    product = SimpleNamespace(price=price)
+    expected = (quantity + 1) // 2 * price + quantity // 2 * price * 0.5
+    promotion = SecondHalfPrice("Second Half price!")
+    assert promotion.apply_promotion(product, quantity) == pytest.approx(
+        expected
+        )
+
+
+@pytest.mark.parametrize("quantity", QUANTITIES, ids=QUANTITY_IDS)
+@pytest.mark.parametrize("price", PRICES, ids=PRICE_IDS)
+def test_third_one_free_matches_formula(ThirdOneFree, price, quantity):
+    """
+    Tests that every third item is free.
+    """
+    product = SimpleNamespace(price=price)
+    expected = ((quantity // 3) * 2 + quantity % 3) * price
+    promotion = ThirdOneFree("Third One Free!")
+    assert promotion.apply_promotion(product, quantity) == pytest.approx(
+        expected
+        )
+
+
+def test_second_half_price_keeps_original_rounding(SecondHalfPrice):
+    """
+    Tests that the table path gives the same float results as the original
+    per-item arithmetic, down to the last digit.
+    """
+    promotion = SecondHalfPrice("Second Half price!")
+    assert promotion.apply_promotion(SimpleNamespace(price=19.99), 18) == (
+        9 * 19.99 + 9 * 19.99 * 0.5
+        )
+    assert promotion.apply_promotion(SimpleNamespace(price=0.1), 6) == (
+        3 * 0.1 + 3 * 0.1 * 0.5
+        )
+
+
+@pytest.mark.parametrize(
+    "quantity",
+    [256, 300, 1000],
+    ids=["q256", "q300", "q1000"]
+    )
+def test_large_quantity_price_follows_price_type(ThirdOneFree, quantity):
+    """
+    Tests that quantities outside the table are priced from the product's
+    own price, so an int and a float price of equal value each give a
+    result of their own type.
+    """
+    promotion = ThirdOneFree("Third One Free!")
+    int_total = promotion.apply_promotion(SimpleNamespace(price=10), quantity)
+    float_total = promotion.apply_promotion(
+        SimpleNamespace(price=10.0),
+        quantity
+        )
+    assert isinstance(int_total, int)
+    assert isinstance(float_total, float)
+    assert float_total == pytest.approx(int_total)
+
+
+@pytest.mark.parametrize("percent", [-1, 101], ids=["below-0", "above-100"])
+def test_percent_discount_rejects_percent_out_of_range(
+        PercentDiscount,
+        percent
+        ):
+    """
+    Tests that a discount percent outside 0..100 raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        PercentDiscount("Bad discount", percent=percent)
+
+
+@pytest.mark.parametrize("percent, expected", [
+    (0, 500.0),  # No discount
+    (100, 0.0),  # Everything free
+    ], ids=["0", "100"])
+def test_percent_discount_accepts_range_bounds(
+        PercentDiscount,
+        percent,
+        expected
+        ):
+    """
+    Tests that 0 and 100 percent are valid and priced correctly.
+    """
+    promotion = PercentDiscount("Discount", percent=percent)
+    assert promotion.apply_promotion(
+        SimpleNamespace(price=100),
+        5
+        ) == pytest.approx(expected)
@@ -0,0 +1,153 @@
+"""
+Unit tests for the Store class.
+
+This module tests that the store's cached views of its products stay in
+sync with the products themselves.
+"""
+
+import pytest
+
+
+def test_get_all_products_returns_only_active_products(Product, Store):
+    """
+    Tests that inactive products are not listed by the store.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    old_stock = Product("Old Stock Item", price=10, quantity=0)
+    best_buy = Store([macbook, old_stock])
+    assert best_buy.get_all_products() == [macbook]
+
+
+def test_get_all_products_follows_activation_changes(Product, Store):
+    """
+    Tests that (de)activating a product updates the store's product list
+    while keeping the original product order.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([macbook, pixel])
+    macbook.deactivate()
+    assert best_buy.get_all_products() == [pixel]
+    macbook.activate()
+    assert best_buy.get_all_products() == [macbook, pixel]
+
+
+def test_get_all_products_after_buying_all_stock(Product, Store):
+    """
+    Tests that a product sold out through an order leaves the product list.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=2)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([macbook, pixel])
+    best_buy.order([(macbook, 2)])
+    assert best_buy.get_all_products() == [pixel]
+
+
+def test_add_and_remove_product_update_product_list(Product, Store):
+    """
+    Tests that adding and removing products updates the product list.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([])
+    best_buy.add_product(macbook)
+    assert best_buy.get_all_products() == [macbook]
+    best_buy.remove_product(macbook)
+    assert best_buy.get_all_products() == []
+    # A removed product no longer affects the store
+    macbook.deactivate()
+    macbook.activate()
+    assert best_buy.get_all_products() == []
+
+
+def test_get_total_quantity_follows_orders_and_inventory_changes(
+        Product,
+        Store
+        ):
+    """
+    Tests that the total quantity reflects orders, added and removed products.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    best_buy = Store([macbook, earbuds])
+    assert best_buy.get_total_quantity() == 600
+    best_buy.order([(macbook, 1), (earbuds, 2)])
+    assert best_buy.get_total_quantity() == 597
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy.add_product(pixel)
+    assert best_buy.get_total_quantity() == 847
+    best_buy.remove_product(macbook)
+    assert best_buy.get_total_quantity() == 748
+    earbuds.set_quantity(0)
+    assert best_buy.get_total_quantity() == 250
+
+
+def test_remove_product_keeps_remaining_products(Product, Store):
+    """
+    Tests that removing products from any position keeps all other products
+    in their original order, and that removing a missing product does
+    nothing.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    windows = Product("Windows License", price=125, quantity=10)
+    best_buy = Store([macbook, earbuds, pixel, windows])
+    # Reactivation rebuilds the active list from the store's product order
+    earbuds.deactivate()
+    best_buy.remove_product(macbook)
+    earbuds.activate()
+    assert best_buy.get_all_products() == [earbuds, pixel, windows]
+    best_buy.remove_product(macbook)  # Already removed
+    best_buy.remove_product(pixel)
+    assert best_buy.get_all_products() == [earbuds, windows]
+    assert best_buy.get_total_quantity() == 510
+    # Positions stay correct for products after a removed one
+    best_buy.remove_product(windows)
+    assert best_buy.get_all_products() == [earbuds]
+
+
+def test_order_merges_lines_for_the_same_product(
+        Product,
+        Store,
+        SecondHalfPrice
+        ):
+    """
+    Tests that repeated lines for one product are bought as one purchase,
+    so quantity-based promotions apply to the combined quantity.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    macbook.set_promotion(SecondHalfPrice("Second Half price!"))
+    best_buy = Store([macbook])
+    total_price = best_buy.order([(macbook, 1), (macbook, 1)])
+    assert total_price == pytest.approx(2175.0, rel=1e-9)  # 1450 * 1.5
+    assert macbook.get_quantity() == 98
+
+
+def test_order_fails_merged_lines_as_a_whole(
+        Product,
+        Store,
+        LimitedProduct,
+        capsys
+        ):
+    """
+    Tests that merged lines exceeding the stock or the per-order maximum buy
+    nothing of that product, while other products are still bought.
+    """
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    shipping = LimitedProduct("Shipping", price=10, quantity=250, maximum=1)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([macbook, shipping, pixel])
+    total_price = best_buy.order([
+        (macbook, 60),
+        (shipping, 1),
+        (macbook, 60),  # 120 in total, only 100 in stock
+        (shipping, 1),  # 2 in total, only 1 per order
+        (pixel, 1)
+        ])
+    assert total_price == pytest.approx(500.0)  # Only the pixel is bought
+    assert macbook.get_quantity() == 100
+    assert shipping.get_quantity() == 250
+    assert pixel.get_quantity() == 249
+    output = capsys.readouterr().out
+    assert "Error ordering MacBook Air M2" in output
+    assert "Error ordering Shipping" in output